@@ -12,20 +12,28 @@ numpy values and formatting reals in various formats
 """
 # ===========================================================================
 import re
+import math
 import inspect
 
 import numpy as np
 from numpy.lib.function_base import iterable
+
+import logging
+logger = logging.getLogger(__name__)
+
 try:
     import deltasigma as ds
     from deltasigma import simulateDSM, synthesizeNTF
-    print("DS Backends:", ds.simulation_backends)
+    logger.info("DS Backends: %s", ds.simulation_backends)
     DS = True
 except ImportError:
     DS = False
 
-import logging
-logger = logging.getLogger(__name__)
+try:
+    from numba import njit, prange
+    NUMBA = True
+except ImportError:
+    NUMBA = False
 
 
 # TODO: Absolute value for WI is taken, no negative WI specifications possible
@@ -39,6 +47,25 @@ def qstr(text):
     return str(text)
 
 
+def _str2num(s):
+    """
+    Convert string `s` to a float or, failing that, to a complex number.
+    Strings that cannot be parsed at all return 0. This is the elementwise
+    fallback for string arrays that cannot be cast to a number type in bulk.
+    """
+    s = str(s).replace(' ', '')  # remove all whitespace
+    if s == '':
+        return 0.0
+    try:
+        return float(s)
+    except ValueError:
+        try:
+            return complex(s)
+        except ValueError:
+            logger.error(f"'{s}' cannot be converted to a number.")
+            return 0.0
+
+
 def bin2hex(bin_str, WI=0):
     """
     Convert number `bin_str` in binary format to hex formatted string.
@@ -46,55 +73,25 @@ def bin2hex(bin_str, WI=0):
     and after the radix point (position given by `WI`) is a multiple of 4.
     """
 
-    wmap = {
-        '0000': '0',
-        '0001': '1',
-        '0010': '2',
-        '0011': '3',
-        '0100': '4',
-        '0101': '5',
-        '0110': '6',
-        '0111': '7',
-        '1000': '8',
-        '1001': '9',
-        '1010': 'A',
-        '1011': 'B',
-        '1100': 'C',
-        '1101': 'D',
-        '1110': 'E',
-        '1111': 'F'
-        }
-
     hex_str = ""
 
     if WI > 0:
         # slice string with integer bits and prepend with zeros to obtain a
-        # multiple of 4 length:
+        # multiple of 4 length, then convert the whole slice at once:
         bin_i_str = bin_str[:WI+1]
-        while (len(bin_i_str) % 4 != 0):
-            bin_i_str = "0" + bin_i_str
-
-        i = 0
-        while (i < len(bin_i_str)):  # map chunks of 4 binary bits to one hex digit
-            hex_str = hex_str + wmap[bin_i_str[i:i + 4]]
-            i = i + 4
+        bin_i_str = "0" * (-len(bin_i_str) % 4) + bin_i_str
+        hex_str = format(int(bin_i_str, 2), '0{0}X'.format(len(bin_i_str) // 4))
     else:
         hex_str = bin_str[0]  # copy MSB as sign bit
 
     WF = len(bin_str) - WI - 1
     # slice string with fractional bits and append with zeros to obtain a
-    # multiple of 4 length:
+    # multiple of 4 length, then convert the whole slice at once:
     if WF > 0:
-        hex_str = hex_str + '.'
         bin_f_str = bin_str[WI+1:]
-
-        while (len(bin_f_str) % 4 != 0):
-            bin_f_str = bin_f_str + "0"
-
-        i = 0
-        while (i < len(bin_f_str)):  # map chunks of 4 binary bits to one hex digit
-            hex_str = hex_str + wmap[bin_f_str[i:i + 4]]
-            i = i + 4
+        bin_f_str = bin_f_str + "0" * (-len(bin_f_str) % 4)
+        hex_str = hex_str + '.'\
+            + format(int(bin_f_str, 2), '0{0}X'.format(len(bin_f_str) // 4))
 
     # hex_str = hex_str.lstrip("0") # remove leading zeros
     hex_str = "0" if len(hex_str) == 0 else hex_str
@@ -104,6 +101,66 @@ def bin2hex(bin_str, WI=0):
 bin2hex_vec = np.vectorize(bin2hex)  # safer than frompyfunction()
 
 
+# ASCII codes of the hex digits, indexed by nibble value
+_HEX_LUT = np.frombuffer(b'0123456789ABCDEF', dtype=np.uint8)
+
+
+def _dec2hex_array(vals, nbits):
+    """
+    Bulk form of `dec2hex()`: convert integer array `vals` to an array of
+    two's complement hex strings with a fixed width of ceil(nbits / 4) digits.
+
+    All nibbles are extracted with vectorized shift / mask operations and
+    mapped to their ASCII codes via a lookup table, avoiding per-element
+    Python string formatting.
+    """
+    n_nibbles = (nbits + 3) // 4
+    mask = (np.int64(1) << nbits) - 1
+    u = np.bitwise_and(np.ravel(vals).astype(np.int64), mask)
+    shifts = np.arange(n_nibbles - 1, -1, -1) * 4
+    nibbles = (u[:, None] >> shifts) & 0xF
+    chars = np.ascontiguousarray(_HEX_LUT[nibbles])
+    hex_strs = chars.view('S{0}'.format(n_nibbles)).ravel().astype(str)
+    return hex_strs.reshape(np.shape(vals))
+
+
+def _fix2hex_array(vals, W, WI):
+    """
+    Bulk form of `bin2hex()` operating directly on the integer representation:
+    convert an array of two's complement fixpoint integers `vals` with a
+    wordlength of `W` bits (`WI` of them integer bits) to hex strings with
+    a radix point, skipping the intermediate binary strings entirely.
+
+    As in `bin2hex()`, integer and fractional bit groups are zero-padded to a
+    multiple of 4 bits; for `WI <= 0` the integer part is just the sign bit.
+    """
+    u = np.bitwise_and(np.ravel(vals).astype(np.int64), (np.int64(1) << W) - 1)
+    n_frc = W - WI - 1  # number of bits behind the radix point
+    if WI > 0:
+        n_i = (WI + 1 + 3) // 4  # sign + integer bits, zero-padded in front
+        i_val = u >> n_frc
+    else:
+        n_i = 1  # only the sign bit is left of the radix point
+        i_val = u >> (W - 1)
+    if n_frc > 0:
+        n_f = (n_frc + 3) // 4  # fractional bits, zero-padded at the end
+        f_val = (u & ((np.int64(1) << n_frc) - 1)) << (-n_frc % 4)
+        width = n_i + 1 + n_f
+    else:
+        n_f = 0
+        width = n_i
+
+    chars = np.empty((u.size, width), dtype=np.uint8)
+    shifts_i = np.arange(n_i - 1, -1, -1) * 4
+    chars[:, :n_i] = _HEX_LUT[(i_val[:, None] >> shifts_i) & 0xF]
+    if n_f > 0:
+        chars[:, n_i] = ord('.')
+        shifts_f = np.arange(n_f - 1, -1, -1) * 4
+        chars[:, n_i + 1:] = _HEX_LUT[(f_val[:, None] >> shifts_f) & 0xF]
+    return chars.view('S{0}'.format(width)).ravel().astype(str).reshape(
+        np.shape(vals))
+
+
 # ------------------------------------------------------------------------------
 def dec2hex(val, nbits, WF=0):
     """
@@ -113,9 +170,12 @@ def dec2hex(val, nbits, WF=0):
     format. The built-in hex function returns args < 0 as negative values.
     When val >= 2**nbits, it is "wrapped" around to the range 0 ... 2**nbits-1
 
+    Array-like arguments are converted in bulk by `_dec2hex_array()`, returning
+    fixed-width hex strings.
+
     Parameters
     ----------
-    val: integer
+    val: integer or array-like of integers
         The value to be converted in decimal integer format.
 
     nbits: integer
@@ -123,8 +183,10 @@ def dec2hex(val, nbits, WF=0):
 
     Returns
     -------
-    A string in two's complement hex format
+    A string (or array of strings) in two's complement hex format
     """
+    if np.ndim(val) > 0:
+        return _dec2hex_array(val, nbits)
 
     return "{0:X}".format(np.int64((val + (1 << nbits)) % (1 << nbits)))
 
@@ -225,7 +287,228 @@ def dec2csd(dec_val, WF=0):
     return csd_str
 
 
-dec2csd_vec = np.frompyfunc(dec2csd, 2, 1)
+# dispatch table mapping the 'quant' setting to its rounding function
+QUANT_FNS = {
+    'floor': np.floor,  # largest integer i, such that i <= x (binary truncation)
+    'round': np.rint,   # rounding, also = binary rounding; np.rint is the
+                        # direct ufunc behind np.round for 0 decimals (IEEE
+                        # round-half-to-even, same as Python's round())
+    'fix': np.trunc,    # round to nearest integer towards zero
+                        # ("Betragsschneiden"); same as np.fix, but np.trunc
+                        # is a real ufunc and hence safe for in-place use
+    'ceil': np.ceil,    # smallest integer i, such that i >= x
+    'rint': np.rint,    # round towards nearest int
+    'none': None        # no quantization
+    }
+
+# integer codes for the quantization / overflow methods of `_fixp_kernel()`
+_QUANT_CODES = {'floor': 0, 'round': 1, 'fix': 2, 'ceil': 3, 'rint': 4, 'none': 5}
+_OVFL_CODES = {'none': 0, 'sat': 1, 'wrap': 2}
+
+# minimum array size for dispatching to the parallel numba kernel; below
+# this, the call overhead of the compiled kernel exceeds its gain over the
+# vectorized NumPy path
+_NUMBA_MIN_SIZE = 1024
+
+if NUMBA:
+    @njit(cache=True, parallel=True)
+    def _fixp_kernel(y, yq, ovr_flag, scale, inv_lsb, post_scale, min_i, max_i,
+                     msb4_i, quant_code, ovfl_code):
+        """
+        Fused scaling / quantization / saturation kernel for `Fixed.fixp()`:
+        process 1D float64 array `y` in a single compiled pass, writing the
+        result to `yq` and the overflow flags to `ovr_flag`.
+
+        All arithmetic runs in the integer representation (LSB units), i.e.
+        `min_i`, `max_i` and `msb4_i` are MIN, MAX and 4 MSB divided by the
+        LSB; the result is multiplied by `post_scale` (the LSB for floating
+        point output, 1 for integer output).
+
+        Return the number of negative and positive overflows.
+        """
+        n_neg = 0
+        n_pos = 0
+        # two's complement wraparound is a bitmask on the integer
+        # representation when the values are quantized and the wordlength
+        # fits into an int64 (bias = 2**(W-1) in LSB units):
+        use_mask = quant_code != 5 and 0.5 * msb4_i < 2.0 ** 62
+        bias = np.int64(np.rint(0.5 * msb4_i)) if use_mask else np.int64(0)
+        for i in prange(y.size):
+            v = y[i] * scale * inv_lsb
+            if quant_code == 0:    # floor
+                q = np.floor(v)
+            elif quant_code == 1:  # round (= rint for whole numbers)
+                q = np.rint(v)
+            elif quant_code == 2:  # fix
+                q = np.trunc(v)
+            elif quant_code == 3:  # ceil
+                q = np.ceil(v)
+            elif quant_code == 4:  # rint
+                q = np.rint(v)
+            else:                  # none
+                q = v
+
+            flag = 0
+            if ovfl_code != 0:
+                if q > max_i:
+                    flag = 1
+                    n_pos += 1
+                elif q < min_i:
+                    flag = -1
+                    n_neg += 1
+                if ovfl_code == 1:    # saturate
+                    if flag == 1:
+                        q = max_i
+                    elif flag == -1:
+                        q = min_i
+                elif flag != 0:       # two's complement wraparound
+                    if use_mask and abs(q) < 2.0 ** 62:
+                        iv = np.int64(np.rint(q))
+                        iv = ((iv + bias) & (2 * bias - 1)) - bias
+                        q = np.float64(iv)
+                    else:
+                        q = q - msb4_i * np.trunc(
+                            (np.sign(q) * 0.5 * msb4_i + q) / msb4_i)
+            yq[i] = q * post_scale
+            ovr_flag[i] = flag
+        return n_neg, n_pos
+
+
+# characters for the four CSD digit codes produced by `_dec2csd_fill()`
+_CSD_CHARS = np.array(['0', '+', '-', '.'])
+
+if NUMBA:
+    @njit(cache=True)
+    def _dec2csd_fill(dec_val, WF, out):
+        """
+        Fill `out` with the CSD digit codes 0 = '0', 1 = '+', 2 = '-', 3 = '.'
+        for `dec_val` with `WF` fractional places and return the number of
+        digits. This is the nopython twin of the scalar `dec2csd()` routine.
+        """
+        n = 0
+        if dec_val == 0.0:
+            out[0] = 0
+            return 1
+        if abs(dec_val) < 1.0:
+            k = 0
+        else:
+            k = int(np.ceil(np.log2(abs(dec_val) * 1.5)))
+
+        remainder = dec_val
+        prev_non_zero = False
+        k -= 1        # current exponent in the CSD string under construction
+        p = 2.0 ** k  # weight of the current digit, halved each iteration
+
+        while k >= -WF:  # has the last fractional digit been reached?
+            limit = 2.0 * p / 3.0
+
+            # decimal point?
+            if k == -1:
+                if n == 0:
+                    if dec_val > limit:
+                        remainder -= 1.0
+                        out[0] = 1
+                        out[1] = 3
+                        n = 2
+                        prev_non_zero = True
+                    elif dec_val < -limit:
+                        remainder += 1.0
+                        out[0] = 2
+                        out[1] = 3
+                        n = 2
+                        prev_non_zero = True
+                    else:
+                        out[0] = 0
+                        out[1] = 3
+                        n = 2
+                else:
+                    out[n] = 3
+                    n += 1
+
+            # convert the number
+            if prev_non_zero:
+                out[n] = 0
+                prev_non_zero = False
+            elif remainder > limit:
+                out[n] = 1
+                remainder -= p
+                prev_non_zero = True
+            elif remainder < -limit:
+                out[n] = 2
+                remainder += p
+                prev_non_zero = True
+            else:
+                out[n] = 0
+            n += 1
+            k -= 1
+            p *= 0.5
+        return n
+
+    @njit(cache=True, parallel=True)
+    def _dec2csd_kernel(vals, WF, out, lengths):
+        """ Run `_dec2csd_fill()` over all elements of 1D array `vals` """
+        for i in prange(vals.size):
+            lengths[i] = _dec2csd_fill(vals[i], WF, out[i])
+
+
+_dec2csd_pyfunc = np.frompyfunc(dec2csd, 2, 1)
+
+
+def dec2csd_vec(dec_val, WF=0):
+    """
+    Vectorized form of `dec2csd()`: convert scalar or array-like `dec_val`
+    to (an array of) strings in CSD format with `WF` fractional places.
+
+    When numba is available, the digits are calculated in a compiled parallel
+    kernel, otherwise fall back to elementwise conversion via `np.frompyfunc`.
+    """
+    vals = np.asarray(dec_val, dtype=np.float64)
+    if vals.size == 0 or not NUMBA or not np.all(np.isfinite(vals)):
+        # empty arrays would break the np.max() reduction below
+        return _dec2csd_pyfunc(dec_val, WF)
+
+    vals_1d = np.atleast_1d(vals).ravel()
+    max_abs = np.max(np.abs(vals_1d))
+    if max_abs < 1.0:
+        k_max = 0
+    else:
+        k_max = int(np.ceil(np.log2(max_abs * 1.5)))
+    # k_max integer digits + WF fractional digits + radix point + margin:
+    codes = np.zeros((vals_1d.size, k_max + WF + 3), dtype=np.int8)
+    lengths = np.zeros(vals_1d.size, dtype=np.int64)
+    _dec2csd_kernel(vals_1d, WF, codes, lengths)
+
+    chars = _CSD_CHARS[codes]
+    csd_strs = np.array(["".join(chars[i, :lengths[i]])
+                         for i in range(vals_1d.size)], dtype=object)
+    if np.ndim(dec_val) == 0:
+        return csd_strs[0]
+    return csd_strs.reshape(np.shape(dec_val))
+
+
+# lazily populated lookup tables mapping two's complement integers to their
+# CSD string representation, keyed by word format (W, WF):
+_csd_lut_cache = {}
+
+
+def _csd_lut(W, WF):
+    """
+    Return a lookup table (object array of length ``2**W``) with the CSD
+    strings for all two's complement integers -2**(W-1) ... 2**(W-1) - 1
+    with `WF` fractional places, offset by ``2**(W-1)``.
+
+    The table is built on first use for a given `(W, WF)` combination and
+    cached; bulk conversions then reduce to a single fancy-indexing
+    operation without any per-element conversion.
+    """
+    lut = _csd_lut_cache.get((W, WF))
+    if lut is None:
+        lsb = 2. ** -WF
+        lut = np.array([dec2csd(i * lsb, WF)
+                        for i in range(-(1 << (W - 1)), 1 << (W - 1))],
+                       dtype=object)
+        _csd_lut_cache[(W, WF)] = lut
+    return lut
 
 
 # ------------------------------------------------------------------------------
@@ -256,33 +539,91 @@ def csd2dec(csd_str):
     -0+0 = -2³ + 2¹ = -6
 
     """
-    # logger.debug("Converting: {0}".format(csd_str))
-
     # Intialize calculation, start with the MSB (integer)
     msb_power = len(csd_str) - 1
-    dec_val = 0.0
-
-    # start from the MSB and work all the way down to the last digit
-    for ii in range(len(csd_str)):
-
-        power_of_two = 2.0**(msb_power-ii)
-
-        if csd_str[ii] == '+':
-            dec_val += power_of_two
-        elif csd_str[ii] == '-':
-            dec_val -= power_of_two
+    dec_val = 0
+
+    # start from the MSB and work all the way down to the last digit,
+    # accumulating exact integer powers of two via bit shifts
+    for ii, digit in enumerate(csd_str):
+        if digit == '+':
+            dec_val += 1 << (msb_power - ii)
+        elif digit == '-':
+            dec_val -= 1 << (msb_power - ii)
         # else
         #    ... all other values are ignored
 
-        # logger.debug('  "{0:s}" (QI = {1:d}); 2**{2:d} = {3}; Num={4:f}'.format(
-        #        csd_str[ii], len(csd_str), msb_power-ii, power_of_two, dec_val))
-
     return dec_val
 
 
 # csd2dec_vec = np.frompyfunc(csd2dec, 1, 1)
 csd2dec_vec = np.vectorize(csd2dec)  # safer than np.frompyfunc()
 
+# vectorized form of np.binary_repr(value, width)
+binary_repr_vec = np.frompyfunc(np.binary_repr, 2, 1)
+
+
+def dec2bin_arr(vals, W, point_pos=None):
+    """
+    Bulk form of `np.binary_repr()`: convert integer array `vals` to an array
+    of two's complement binary strings with a wordlength of `W` <= 64 bits.
+    When `point_pos` is given (`0 <= point_pos < W - 1`), a binary point is
+    inserted after the sign and integer bits (position `point_pos`) in the
+    same pass, making a separate `insert_binary_point()` call unnecessary.
+
+    The bits of all elements are extracted in one `np.unpackbits` pass over
+    the byte view and the characters (point included) are assembled with
+    slice assignments into one byte matrix instead of formatting each
+    element in Python. This keeps the character assembly in C-level NumPy
+    ops without requiring a compiled extension, keeping pyfda installable
+    as a pure Python package.
+    """
+    u = np.ravel(vals).astype(np.int64).astype(np.uint64)
+    u &= np.uint64(2 ** W - 1)
+    bits = np.unpackbits(u.astype('>u8').view(np.uint8).reshape(-1, 8),
+                         axis=1)[:, -W:]
+    if point_pos is None:
+        chars = np.ascontiguousarray(bits + np.uint8(ord('0')))
+        width = W
+    else:
+        p = point_pos + 1  # column of the binary point
+        width = W + 1
+        chars = np.empty((u.size, width), dtype=np.uint8)
+        np.add(bits[:, :p], np.uint8(ord('0')), out=chars[:, :p])
+        chars[:, p] = ord('.')
+        np.add(bits[:, p:], np.uint8(ord('0')), out=chars[:, p + 1:])
+    return chars.view('S{0}'.format(width)).ravel().astype(str).reshape(
+        np.shape(vals))
+
+# elementwise fallback for inserting the binary point in string `bin_str`
+# after position `pos`
+_insert_binary_point_vec = np.vectorize(lambda bin_str, pos: (
+                                bin_str[:pos+1] + "." + bin_str[pos+1:]))
+
+
+def insert_binary_point(bin_str, pos):
+    """
+    Insert a binary point after the sign and integer bits (position `pos`)
+    of string or array of strings `bin_str`.
+
+    Arrays of equal-width strings (as returned by `dec2bin_arr()`) are split
+    with a single character-view reshape and rejoined via `np.char.add`,
+    i.e. without looping over the elements in Python. Scalars and ragged
+    (object dtype) arrays fall back to elementwise insertion.
+    """
+    arr = np.asarray(bin_str)
+    if arr.ndim > 0 and arr.dtype.kind == 'U':
+        w = arr.dtype.itemsize // 4  # itemsize is in bytes, 4 per character
+        if 0 <= pos < w - 1:
+            chars = np.ascontiguousarray(arr).ravel().view('U1').reshape(-1, w)
+            left = np.ascontiguousarray(
+                chars[:, :pos + 1]).view(f'U{pos + 1}').ravel()
+            right = np.ascontiguousarray(
+                chars[:, pos + 1:]).view(f'U{w - pos - 1}').ravel()
+            return np.char.add(np.char.add(left, '.'),
+                               right).reshape(arr.shape)
+    return _insert_binary_point_vec(bin_str, pos)
+
 
 # ------------------------------------------------------------------------
 class Fixed(object):
@@ -462,16 +803,25 @@ class Fixed(object):
         # create a reference to the dict passed during construction as instance attribute
         self.q_dict = q_dict
 
+        # lazily grown int64 scratch buffer for integer output, see fixp()
+        self._int_scratch = None
+
+        # formatting methods of float2frmt(), dispatched by 'fx_base'
+        self._fmt_fns = {'dec': self._fmt_dec, 'csd': self._fmt_csd,
+                         'bin': self._fmt_bin, 'hex': self._fmt_hex}
+
         self.set_qdict({})  # trigger calculation of parameters
         self.resetN()       # initialize overflow-counter
 
-        # arguments for regex replacement with illegal characters
-        # ^ means "not", | means "or" and \ escapes
+        # precompiled regexes matching illegal characters for each format
+        # ^ means "not" and \ escapes; the old classes contained literal '|'
+        # characters (no "or" inside character classes) which wrongly
+        # survived the character substitution as legal digits
         self.FRMT_REGEX = {
-                'bin': r'[^0|1|.|,|\-]',
-                'csd': r'[^0|\+|\-|.|,]',
-                'dec': r'[^0-9Ee|.|,|\-]',
-                'hex': r'[^0-9A-Fa-f|.|,|\-]'
+                'bin': re.compile(r'[^01.,\-]'),
+                'csd': re.compile(r'[^0\+\-.,]'),
+                'dec': re.compile(r'[^0-9Ee.,\-]'),
+                'hex': re.compile(r'[^0-9A-Fa-f.,\-]')
                         }
         # provide frmt2float function for arrays, swallow the `self` argument
         self.frmt2float_vec = np.vectorize(self.frmt2float_scalar, excluded='self')
@@ -542,6 +892,28 @@ class Fixed(object):
         self.q_dict['MAX'] =  2. * self.q_dict['MSB'] - self.q_dict['LSB']
         self.q_dict['MIN'] = -2. * self.q_dict['MSB']
 
+        # cache frequently used multiples / reciprocals for the hot path of
+        # fixp(); LSB and MSB are powers of two, hence the reciprocals are
+        # exact and multiplying by them equals dividing by LSB resp. 4 MSB
+        self._inv_lsb = 1. / self.q_dict['LSB']
+        self._two_msb = 2. * self.q_dict['MSB']
+        self._four_msb = 4. * self.q_dict['MSB']
+        self._inv_four_msb = 1. / self._four_msb
+        # MIN / MAX in LSB units, i.e. in the integer representation:
+        self._min_i = self.q_dict['MIN'] * self._inv_lsb  # = -2**(W-1)
+        self._max_i = self.q_dict['MAX'] * self._inv_lsb  # = 2**(W-1) - 1
+        # invalidate the memoized quantization / overflow codes, see _fx_codes()
+        self._codes_key = (None, None)
+        # narrowest integer dtype that holds all W-bit two's complement
+        # values; halves resp. quarters the memory traffic of the integer
+        # output stage for the typical W <= 15 / W <= 31 word lengths
+        if self.q_dict['W'] <= 15:
+            self._int_dtype = np.int16
+        elif self.q_dict['W'] <= 31:
+            self._int_dtype = np.int32
+        else:
+            self._int_dtype = np.int64
+
         # Calculate required number of places for different bases from total
         # number of bits:
         if self.q_dict['fx_base'] == 'dec':
@@ -565,7 +937,109 @@ class Fixed(object):
                 u'Unknown number format "{0:s}"!'.format(self.q_dict['fx_base']))
 
 # ------------------------------------------------------------------------------
-    def fixp(self, y, scaling='mult'):
+    def _fx_codes(self):
+        """
+        Return the integer codes for the current 'quant' and 'ovfl' settings
+        (-1 for methods without a code, e.g. 'dsm'), memoized on the setting
+        strings. The codes cannot be frozen in `set_qdict()` because the
+        fixpoint GUI widgets update `q_dict` directly, so the key is
+        re-checked (two string comparisons) on every call instead of
+        re-running the dict lookups.
+        """
+        key = (self.q_dict['quant'], self.q_dict['ovfl'])
+        if key != self._codes_key:
+            self._codes_key = key
+            self._quant_code = _QUANT_CODES.get(key[0], -1)
+            self._ovfl_code = _OVFL_CODES.get(key[1], -1)
+        return self._quant_code, self._ovfl_code
+
+# ------------------------------------------------------------------------------
+    def _to_int_scratch(self, yq):
+        """
+        Round the float64 array `yq` (in place) and copy it into the lazily
+        grown integer scratch buffer, reusing the allocation across calls
+        instead of paying a fresh `astype()` buffer per conversion.
+
+        Saturated / wrapped values fit the narrowest dtype for `W` bits
+        (`self._int_dtype`); with `ovfl == 'none'` the values are unbounded
+        and the buffer stays int64.
+
+        The returned array is a view into the scratch buffer and only valid
+        until the next integer conversion on this instance.
+        """
+        dtype = self._int_dtype if self.q_dict['ovfl'] != 'none' else np.int64
+        if (self._int_scratch is None or self._int_scratch.size < yq.size
+                or self._int_scratch.dtype != dtype):
+            self._int_scratch = np.empty(yq.size, dtype=dtype)
+        yq_i = self._int_scratch[:yq.size].reshape(yq.shape)
+        if yq.dtype.kind == 'f':  # wrapped values may already be int64
+            np.rint(yq, out=yq)
+        np.copyto(yq_i, yq, casting='unsafe')
+        return yq_i
+
+# ------------------------------------------------------------------------------
+    def _fixp_scalar(self, y, scaling='mult', int_frmt=False):
+        """
+        Quantize a single real number `y` without touching NumPy.
+
+        This is the fast path of `fixp()` for scalar floats / ints: the GUI
+        delegates quantize one value per table cell, where the NumPy dispatch
+        overhead of the array path dominates the actual arithmetic. Scaling,
+        quantization and overflow handling mirror `fixp()` bit for bit using
+        `math.floor()` / `round()` / `math.trunc()` / `math.ceil()`.
+        """
+        q_dict = self.q_dict
+        if scaling in {'mult', 'multdiv'}:
+            y = y * q_dict['scale']
+        yq = y * self._inv_lsb  # scale to LSB units (quantization step = 1)
+
+        quant = q_dict['quant']
+        if quant == 'floor':
+            yq = math.floor(yq)
+        elif quant in {'round', 'rint'}:
+            yq = round(yq)  # round half to even, like np.round / np.rint
+        elif quant == 'fix':
+            yq = math.trunc(yq)
+        elif quant == 'ceil':
+            yq = math.ceil(yq)
+        # 'none': yq remains unquantized
+
+        if q_dict['ovfl'] != 'none':
+            ovr_flag = 0
+            if yq > self._max_i:
+                ovr_flag = 1
+                q_dict['N_over_pos'] += 1
+            elif yq < self._min_i:
+                ovr_flag = -1
+                q_dict['N_over_neg'] += 1
+            q_dict['N_over'] = q_dict['N_over_neg'] + q_dict['N_over_pos']
+            q_dict['N'] = q_dict['N'] + 1
+            q_dict['ovr_flag'] = ovr_flag
+
+            if q_dict['ovfl'] == 'sat':
+                yq = max(self._min_i, min(self._max_i, yq))
+            elif ovr_flag != 0:  # wrap
+                if quant != 'none' and q_dict['W'] < 63 and abs(yq) < 2. ** 62:
+                    # two's complement wraparound as a single bitmask on the
+                    # integer representation:
+                    bias = 1 << (q_dict['W'] - 1)
+                    yq = ((int(yq) + bias) & (2 * bias - 1)) - bias
+                else:
+                    # unquantized or extreme values: wrap in the floating
+                    # point domain (4 MSB resp. 2 MSB in LSB units)
+                    four_msb_i = self._four_msb * self._inv_lsb
+                    yq = yq - four_msb_i * math.trunc(
+                        (math.copysign(0.5 * four_msb_i, yq) + yq) / four_msb_i)
+
+        if int_frmt:
+            return int(round(yq))
+        yq = yq * q_dict['LSB']
+        if scaling in {'div', 'multdiv'}:
+            yq = yq / q_dict['scale']
+        return yq
+
+# ------------------------------------------------------------------------------
+    def fixp(self, y, scaling='mult', int_frmt=False):
         """
         Return fixed-point integer or fractional representation for `y`
         (scalar or array-like) with the same shape as `y`.
@@ -590,11 +1064,22 @@ class Fixed(object):
 
             For all other settings, `y` is transformed unscaled.
 
+        int_frmt: Bool
+            When True, return the fixpoint integer representation (i.e. the
+            quantized value in LSB units) instead of rescaling to float; the
+            output scaling division is skipped. For array input with
+            `ovfl != 'none'` the result is the narrowest integer dtype that
+            can hold `W` bits (int16 / int32 / int64) and is a *view into a
+            per-instance scratch buffer* that is overwritten by the next
+            call - use `fixp_int()` for a detached copy. Used internally by
+            `float2frmt()` for the binary / hex string conversion.
+
         Returns
         -------
         float scalar or ndarray
             with the same shape as `y`, in the range
             `-2*self.q_dict['MSB']` ... `2*self.q_dict['MSB']-self.q_dict['LSB']`
+            or the corresponding integer representation for `int_frmt=True`
 
         Examples
         --------
@@ -624,10 +1109,24 @@ class Fixed(object):
         #       arrays and initialize flags
         # ======================================================================
         scaling = scaling.lower()
+        # bind the dict to a local name once; everything below is hot-path
+        # code where the repeated attribute lookup is measurable
+        q_dict = self.q_dict
+
+        # Pure Python fast path for single real numbers, see `_fixp_scalar()`.
+        # bool is an int subclass but must keep taking the generic path below,
+        # which rejects it like boolean arrays (error logged, result 0):
+        if (isinstance(y, (int, float)) and not isinstance(y, bool)
+                and math.isfinite(y)
+                and q_dict['quant'] in _QUANT_CODES
+                and q_dict['ovfl'] in {'none', 'sat', 'wrap'}
+                and isinstance(q_dict['scale'], (int, float))):
+            return self._fixp_scalar(y, scaling, int_frmt)
+
         # use values from dict for initialization
-        N_over_neg = self.q_dict['N_over_neg']
-        N_over_pos = self.q_dict['N_over_pos']
-        N = self.q_dict['N']
+        N_over_neg = q_dict['N_over_neg']
+        N_over_pos = q_dict['N_over_pos']
+        N = q_dict['N']
 
         if np.shape(y):
             # Input is an array:
@@ -646,14 +1145,13 @@ class Fixed(object):
                     y = y.astype(np.float64)  # try to convert to float
                     N += y.size
                 except (TypeError, ValueError):
+                    y = np.char.replace(y, ' ', '')  # remove all whitespace
                     try:
-                        np.char.replace(y, ' ', '')  # remove all whitespace
                         y = y.astype(complex)  # try to convert to complex
                         N += y.size * 2
-                    # try converting elements recursively:
+                    # parse the elements individually (invalid ones -> 0):
                     except (TypeError, ValueError):
-                        y = np.asarray(list(map(lambda y_scalar:
-                                            self.fixp(y_scalar, scaling=scaling), y)))
+                        y = np.asarray(list(map(_str2num, y)))
                         N += y.size
             else:
                 logger.error("Argument '{0}' is of type '{1}',\n"
@@ -682,50 +1180,103 @@ class Fixed(object):
             ovr_flag = 0
             N += 1
 
-        # convert pseudo-complex (imag = 0) and complex values to real
-        y = np.real_if_close(y)
-        if np.iscomplexobj(y):
-            logger.warning("Casting complex values to real before quantization!")
-            # quantizing complex objects is not supported yet
-            y = y.real
+        # convert pseudo-complex (imag = 0) and complex values to real; skip
+        # the full-array scan of np.real_if_close() for real number types
+        if isinstance(y, np.ndarray):
+            REAL = y.dtype.kind in 'fiub'
+        else:
+            REAL = isinstance(y, (int, float, np.integer, np.floating))
+        if not REAL:
+            y = np.real_if_close(y)
+            if np.iscomplexobj(y):
+                logger.warning("Casting complex values to real before quantization!")
+                # quantizing complex objects is not supported yet
+                y = y.real
+        elif not isinstance(y, (np.generic, np.ndarray)):
+            # coerce plain Python scalars to numpy scalars (real_if_close did
+            # this implicitly before) so the overflow stage below can rely on
+            # ndarray methods like `.astype()`:
+            y = np.float64(y)
 
         y_in = y  # y before scaling / quantizing
+
         # ======================================================================
-        # (2) : INPUT SCALING
-        #       Multiply by `scale` factor before requantization and saturation
-        #       when `scaling=='mult'`or 'multdiv'
+        # Fused numba path for numeric arrays: input scaling, quantization and
+        # overflow handling run in a single compiled pass over the data
         # ======================================================================
-        if scaling in {'mult', 'multdiv'}:
-            y = y * self.q_dict['scale']
+        quant_code, ovfl_code = self._fx_codes()
+        if (NUMBA and not SCALAR and isinstance(y, np.ndarray)
+                and y.size >= _NUMBA_MIN_SIZE
+                and y.dtype.kind in 'fiu'
+                and quant_code >= 0 and ovfl_code >= 0
+                and isinstance(q_dict['scale'],
+                               (int, float, np.integer, np.floating))):
+            if scaling in {'mult', 'multdiv'}:
+                scale = float(q_dict['scale'])
+            else:
+                scale = 1.0
+            y64 = np.ascontiguousarray(y, dtype=np.float64)
+            yq = np.empty_like(y64)
+            ovr_flag = np.zeros(y64.shape, dtype=int)
+            n_neg, n_pos = _fixp_kernel(
+                y64.ravel(), yq.ravel(), ovr_flag.ravel(), scale,
+                self._inv_lsb, 1. if int_frmt else q_dict['LSB'],
+                self._min_i, self._max_i, self._four_msb * self._inv_lsb,
+                quant_code, ovfl_code)
+
+            if q_dict['ovfl'] != 'none':
+                N_over_neg += n_neg
+                N_over_pos += n_pos
+                q_dict.update(
+                    {'N_over_pos': N_over_pos, 'N_over_neg': N_over_neg,
+                     'N_over': N_over_neg + N_over_pos, 'N': N,
+                     'ovr_flag': ovr_flag})
+
+            if int_frmt:
+                yq = self._to_int_scratch(yq)
+            elif scaling in {'div', 'multdiv'}:
+                yq = yq / q_dict['scale']
+            return yq
 
         # ======================================================================
-        # (3) : QUANTIZATION
+        # (2) + (3) : INPUT SCALING AND QUANTIZATION
+        #       Multiply by `scale` factor before requantization and saturation
+        #       when `scaling=='mult'`or 'multdiv'.
         #       Divide by LSB to obtain an intermediate format where the
-        #       quantization step size = 1.
+        #       quantization step size = 1. The input scaling is fused into
+        #       the same multiply: 1 / LSB is a power of two, hence
+        #       `scale / LSB` is exact and the result is bit-identical to two
+        #       separate passes while saving one intermediate array.
         #       Next, apply selected quantization method to convert
         #       floating point inputs to "fixpoint integers".
-        #       Finally, multiply by LSB to restore original scale.
+        #       The result stays in this integer representation (LSB units)
+        #       until the output stage (5).
         # ======================================================================
-        y = y / self.q_dict['LSB']
-
-        if self.q_dict['quant'] == 'floor':
-            yq = np.floor(y)  # largest integer i, such that i <= x (= binary truncation)
-        elif self.q_dict['quant'] == 'round':
-            yq = np.round(y)  # rounding, also = binary rounding
-        elif self.q_dict['quant'] == 'fix':
-            yq = np.fix(y)  # round to nearest integer towards zero ("Betragsschneiden")
-        elif self.q_dict['quant'] == 'ceil':
-            yq = np.ceil(y)  # smallest integer i, such that i >= x
-        elif self.q_dict['quant'] == 'rint':
-            yq = np.rint(y)  # round towards nearest int
-        elif self.q_dict['quant'] == 'dsm':
+        if scaling in {'mult', 'multdiv'}:
+            y = y * (q_dict['scale'] * self._inv_lsb)
+        else:
+            y = y * self._inv_lsb  # same as y / LSB as LSB is a power of two
+
+        quant_fn = QUANT_FNS.get(q_dict['quant'], False)
+        if quant_fn is not False:
+            # look up quantization function from the dispatch table instead of
+            # string-comparing per call; 'none' maps to the identity. `y` is
+            # a fresh intermediate after the scaling multiply, so arrays are
+            # quantized in place:
+            if quant_fn is None:
+                yq = y
+            elif isinstance(y, np.ndarray):
+                yq = quant_fn(y, out=y)
+            else:
+                yq = quant_fn(y)
+        elif q_dict['quant'] == 'dsm':
             if DS:
                 # Synthesize DSM loop filter,
                 # TODO: parameters should be adjustable via quantizer dict
                 H = synthesizeNTF(order=3, osr=64, opt=1)
                 # Calculate DSM stream and shift/scale it from -1 ... +1 to
                 # 0 ... 1 sequence
-                yq = (simulateDSM(y*self.q_dict['LSB'], H)[0]+1)/(2*self.q_dict['LSB'])
+                yq = (simulateDSM(y*q_dict['LSB'], H)[0]+1)/(2*q_dict['LSB'])
                 # returns four ndarrays:
                 # v: quantizer output (-1 or 1)
                 # xn: modulator states.
@@ -734,74 +1285,114 @@ class Fixed(object):
             else:
                 raise Exception('"deltasigma" Toolbox not found.\n'
                                 'Try installing it with "pip install deltasigma".')
-        elif self.q_dict['quant'] == 'none':
-            yq = y  # return unquantized value
         else:
             raise Exception(
-                f'''Unknown Requantization type "{self.q_dict['quant']:s}"!''')
-        yq = yq * self.q_dict['LSB']
+                f'''Unknown Requantization type "{q_dict['quant']:s}"!''')
         # logger.debug("y_in={0} | y={1} | yq={2}".format(y_in, y, yq))
 
         # ======================================================================
-        # (4) : Handle Overflow / saturation w.r.t. to the MSB, returning a
-        #       result in the range MIN = -2*MSB ... + 2*MSB-LSB = MAX
+        # (4) : Handle Overflow / saturation w.r.t. to the MSB; all comparisons
+        #       run on the integer representation against the cached bounds
+        #       MIN / LSB = -2**(W-1) and MAX / LSB = 2**(W-1) - 1
         # ====================================================================
-        if self.q_dict['ovfl'] == 'none':
+        if q_dict['ovfl'] == 'none':
             pass
         else:
             # Bool. vectors with '1' for every neg./pos overflow:
-            over_neg = (yq < self.q_dict['MIN'])
-            over_pos = (yq > self.q_dict['MAX'])
+            over_neg = (yq < self._min_i)
+            over_pos = (yq > self._max_i)
             # create flag / array of flags for pos. / neg. overflows
             ovr_flag = over_pos.astype(int) - over_neg.astype(int)
-            # No. of pos. / neg. / all overflows occured since last reset:
-            N_over_neg += np.sum(over_neg)
-            N_over_pos += np.sum(over_pos)
+            # No. of pos. / neg. / all overflows occured since last reset;
+            # count_nonzero reduces the boolean masks without an int cast:
+            N_over_neg += int(np.count_nonzero(over_neg))
+            N_over_pos += int(np.count_nonzero(over_pos))
             N_over = N_over_neg + N_over_pos
 
-            self.q_dict.update(
+            q_dict.update(
                {'N_over_pos': N_over_pos, 'N_over_neg': N_over_neg, 'N_over': N_over,
                 'N': N, 'ovr_flag': ovr_flag})
 
-            # Replace overflows with Min/Max-Values (saturation):
-            if self.q_dict['ovfl'] == 'sat':
-                yq = np.where(over_pos, self.q_dict['MAX'], yq)  # (cond, true, false)
-                yq = np.where(over_neg, self.q_dict['MIN'], yq)
+            # Replace overflows with Min/Max-Values (saturation); clip arrays
+            # in place as yq is always a fresh float64 intermediate here:
+            if q_dict['ovfl'] == 'sat':
+                if isinstance(yq, np.ndarray):
+                    np.clip(yq, self._min_i, self._max_i, out=yq)
+                else:
+                    yq = np.clip(yq, self._min_i, self._max_i)
             # Replace overflows by two's complement wraparound (wrap)
-            elif self.q_dict['ovfl'] == 'wrap':
-                yq = np.where(
-                    over_pos | over_neg,
-                    yq - 4. * self.q_dict['MSB'] * np.fix(
-                        (np.sign(yq) * 2 * self.q_dict['MSB'] + yq)
-                            / (4 * self.q_dict['MSB'])), yq)
+            elif q_dict['ovfl'] == 'wrap':
+                if (q_dict['quant'] != 'none' and q_dict['W'] < 63
+                        and np.all(np.abs(yq) < 2. ** 62)):
+                    # Quantized values are integers (in LSB units), so the
+                    # wraparound is a single bitmask on the integer
+                    # representation instead of sign / fix / division passes:
+                    i = np.round(np.asarray(yq)).astype(np.int64)
+                    bias = np.int64(1) << (q_dict['W'] - 1)
+                    yq = ((i + bias) & (2 * bias - 1)) - bias
+                else:
+                    # unquantized, non-finite or extreme values: wrap in the
+                    # floating point domain (4 MSB resp. 2 MSB in LSB units)
+                    four_msb_i = self._four_msb * self._inv_lsb
+                    yq = np.where(
+                        over_pos | over_neg,
+                        yq - four_msb_i * np.fix(
+                            (np.sign(yq) * 0.5 * four_msb_i + yq)
+                                / four_msb_i), yq)
             else:
                 raise Exception(
-                    f"""Unknown overflow type "{self.q_dict['ovfl']:s}"!""")
+                    f"""Unknown overflow type "{q_dict['ovfl']:s}"!""")
 
         # ======================================================================
         # (5) : OUTPUT SCALING
-        #       Divide result by `scale` factor when `scaling=='div'`or 'multdiv'
-        #       to obtain correct scaling for floats
+        #       Return the integer representation directly for `int_frmt`,
+        #       else scale back by the LSB and divide the result by `scale`
+        #       when `scaling=='div'`or 'multdiv' to obtain correct scaling
+        #       for floats
         #       - frmt2float() always returns float
         #       - input_coeffs when quantizing the coefficients
         #       float2frmt passes on the scaling argument
         # ======================================================================
-
-        if scaling in {'div', 'multdiv'}:
-            yq = yq / self.q_dict['scale']
+        if int_frmt:
+            if isinstance(yq, np.ndarray):
+                yq = self._to_int_scratch(yq)
+            else:
+                yq = np.round(yq).astype(np.int64)
+        else:
+            yq = yq * q_dict['LSB']
+            if scaling in {'div', 'multdiv'}:
+                yq = yq / q_dict['scale']
 
         if SCALAR and isinstance(yq, np.ndarray):
             yq = yq.item()  # convert singleton array to scalar
 
         return yq
 
+    # --------------------------------------------------------------------------
+    def fixp_int(self, y, scaling='mult'):
+        """
+        Quantize and saturate / wrap `y` like `fixp()` but return the fixpoint
+        integer representation (the value in LSB units) in the range
+        `-2**(W-1)` ... `2**(W-1)-1`, skipping the float round-trip through
+        the LSB scaling. Arrays are returned as the narrowest integer dtype
+        that can hold `W` bits (int16 / int32 / int64); the result is always
+        a fresh array, detached from the internal scratch buffer that
+        `fixp(..., int_frmt=True)` reuses between calls.
+        """
+        yq = self.fixp(y, scaling=scaling, int_frmt=True)
+        if isinstance(yq, np.ndarray):
+            yq = yq.copy()
+        return yq
+
     # --------------------------------------------------------------------------
     def resetN(self):
         """ Reset counters and overflow-flag of Fixed object """
-        frm = inspect.stack()[1]
-        logger.debug("'reset_N' called from {0}.{1}():{2}.".
-                     format(inspect.getmodule(frm[0]).__name__.split('.')[-1],
-                            frm[3], frm[2]))
+        if logger.isEnabledFor(logging.DEBUG):
+            # inspecting the stack is expensive, only do it when debugging
+            frm = inspect.stack()[1]
+            logger.debug("'reset_N' called from %s.%s():%s.",
+                         inspect.getmodule(frm[0]).__name__.split('.')[-1],
+                         frm[3], frm[2])
         self.q_dict.update(
             {'N': 0, 'N_over': 0, 'N_over_neg': 0, 'N_over_pos': 0, 'ovr_flag' : 0})
 
@@ -855,15 +1446,6 @@ class Fixed(object):
             # logger.warning("Input format 'np.str_' not supported!\n\t{0}".format(y))
             y = str(y)
 
-        y_float = y_dec = None
-
-        if frmt == 'float32':
-            float_frmt = np.float32
-            # TODO: not implemented yet
-        elif frmt == 'float16':
-            # TODO: not implemented yet
-            float_frmt = np.float16
-
         if frmt == 'float':
             # this handles floats, np scalars + arrays and strings / string arrays
             try:
@@ -878,10 +1460,26 @@ class Fixed(object):
                         f'to float or complex, setting to zero.')
             return y_float
 
-        elif np.isscalar(y):
+        elif frmt == 'float32':
+            float_frmt = np.float32
+            # TODO: not implemented yet
+        elif frmt == 'float16':
+            # TODO: not implemented yet
+            float_frmt = np.float16
+
+        if np.isscalar(y):
             return self.frmt2float_scalar(y, frmt=frmt)
-        else:
-            return self.frmt2float_vec(y, frmt=frmt)
+        if frmt == 'dec':
+            # bulk path for decimal arrays: numeric arrays and arrays of
+            # clean number strings cast to float64 in one pass, the parsing
+            # loop of the elementwise fallback is only needed for inputs
+            # with illegal characters or ',' decimal separators
+            try:
+                return self.fixp(np.asarray(y, dtype=np.float64),
+                                 scaling='div')
+            except (TypeError, ValueError):
+                pass  # fall through to elementwise parsing
+        return self.frmt2float_vec(y, frmt=frmt)
 
     # --------------------------------------------------------------------------
     def frmt2float_scalar(self, y, frmt=None):
@@ -894,9 +1492,15 @@ class Fixed(object):
         error handling of individual routines,
         remove illegal characters and trailing zeros
         """
-        val_str = re.sub(self.FRMT_REGEX[frmt], r'', str(y)).lstrip('0')
-        if len(val_str) > 0:
+        s = str(y)
+        if ',' not in s and self.FRMT_REGEX[frmt].search(s) is None:
+            # fast path for already clean input (the common case when the
+            # displayed string is re-parsed): skip the character substitution
+            val_str = s.lstrip('0')
+        else:
+            val_str = self.FRMT_REGEX[frmt].sub('', s).lstrip('0')
             val_str = val_str.replace(',', '.')  # ',' -> '.' for German-style numbers
+        if len(val_str) > 0:
             if val_str[0] == '.':  # prepend '0' when the number starts with '.'
                 val_str = '0' + val_str
 
@@ -939,7 +1543,8 @@ class Fixed(object):
                     neg_sign = True
                     raw_str = raw_str.lstrip('-')
 
-                y_dec = abs(int(raw_str, self.base) / self.base**frc_places)
+                raw_int = int(raw_str, self.base)  # parse string only once
+                y_dec = abs(raw_int / self.base**frc_places)
 
                 if y_dec == 0:  # avoid log2(0)
                     return 0
@@ -948,7 +1553,7 @@ class Fixed(object):
                 # When number is outside fixpoint range, discard MSBs:
                 if int_bits > self.q_dict['WI'] + 1:
                     if frmt == 'hex':
-                        raw_str = np.binary_repr(int(raw_str, 16))
+                        raw_str = np.binary_repr(raw_int)
                     # discard the upper bits outside the valid range
                     raw_str = raw_str[int_bits - self.q_dict['WI'] - 1:]
 
@@ -1003,10 +1608,10 @@ class Fixed(object):
         """
         Called a.o. by `itemDelegate.displayText()` for on-the-fly number
         conversion. Returns fixpoint representation for `y` (scalar or array-like)
-        with numeric format `self.frmt` and `self.q_dict['W']` bits. The result has the
+        with numeric format `self.frmt` and `q_dict['W']` bits. The result has the
         same shape as `y`.
 
-        The float is multiplied by `self.q_dict['scale'])` and quantized / saturated
+        The float is multiplied by `q_dict['scale'])` and quantized / saturated
         using `self.fixp()` for all formats before it is converted to different number
         formats.
 
@@ -1019,71 +1624,128 @@ class Fixed(object):
         Returns
         -------
         A string, a float or an ndarray of float or string is returned in the
-        numeric format set in `self.q_dict['fx_base'])`. It has the same shape as `y`.
+        numeric format set in `q_dict['fx_base'])`. It has the same shape as `y`.
          For all formats except `float` a fixpoint representation with
-         `self.q_dict['W']` binary digits is returned.
-
-
-        Define vectorized functions using numpys automatic type casting:
-        Vectorized functions for inserting binary point in string `bin_str`
-        after position `pos`.
-
-        Usage:  insert_binary_point(bin_str, pos)
-
-        Parameters: bin_str : string
-                    pos     : integer
+         `q_dict['W']` binary digits is returned.
         """
-        insert_binary_point = np.vectorize(lambda bin_str, pos: (
-                                    bin_str[:pos+1] + "." + bin_str[pos+1:]))
-
-        binary_repr_vec = np.frompyfunc(np.binary_repr, 2, 1)
         # ======================================================================
+        q_dict = self.q_dict  # avoid repeated attribute lookups below
+        scalar_in = np.ndim(y) == 0  # decide scalar vs. array handling once
 
-        if self.q_dict['fx_base'] == 'float':  # return float input value unchanged (no string)
+        fx_base = q_dict['fx_base']
+        if fx_base == 'float':  # return float input value unchanged (no string)
             return y
-        elif self.q_dict['fx_base'] == 'float32':
+        elif fx_base == 'float32':
             return np.float32(y)
-        elif self.q_dict['fx_base'] == 'float16':
+        elif fx_base == 'float16':
             return np.float16(y)
 
-        elif self.q_dict['fx_base'] in {'hex', 'bin', 'dec', 'csd'}:
-            # return a quantized & saturated / wrapped fixpoint (type float) for y
-            y_fix = self.fixp(y, scaling='mult')
+        # look up the formatting method; resolved per call by the current
+        # 'fx_base' string as e.g. quant_coeffs() switches the base directly
+        # in q_dict
+        fmt_fn = self._fmt_fns.get(fx_base)
+        if fmt_fn is None:
+            raise ValueError(f"""Unknown number format "{fx_base}"!""")
+        y_str = fmt_fn(y)
 
-            if self.q_dict['fx_base'] == 'dec':
-                if self.q_dict['WF'] == 0:
-                    y_str = np.int64(y_fix)  # get rid of trailing zero
-                    # y_str = np.char.mod('%d', y_fix)
-                    # elementwise conversion from integer (%d) to string
-                    # see https://docs.scipy.org/doc/numpy/reference/routines.char.html
-                else:
-                    # y_str = np.char.mod('%f',y_fix)
-                    y_str = y_fix
-            elif self.q_dict['fx_base'] == 'csd':
-                y_str = dec2csd_vec(y_fix, self.q_dict['WF'])  # convert with WF fractional bits
-
-            else:  # bin or hex
-                # represent fixpoint number as integer in the range -2**(W-1) ... 2**(W-1)
-                y_fix_int = np.int64(np.round(y_fix / self.q_dict['LSB']))
-                # convert to (array of) string with 2's complement binary
-                y_bin_str = binary_repr_vec(y_fix_int, self.q_dict['W'])
-
-                if self.q_dict['fx_base'] == 'hex':
-                    y_str = bin2hex_vec(y_bin_str, self.q_dict['WI'])
-
-                else:  # self.q_dict['fx_base']t == 'bin':
-                    # insert radix point if required
-                    if self.q_dict['WF'] > 0:
-                        y_str = insert_binary_point(y_bin_str, self.q_dict['WI'])
-                    else:
-                        y_str = y_bin_str
+        if scalar_in and isinstance(y_str, np.ndarray):
+            y_str = y_str.item()  # convert singleton array to scalar
+
+        return y_str
+
+    # --------------------------------------------------------------------------
+    def _in_int_range(self, y_fix_int):
+        """Return True when all values of `y_fix_int` fit the W-bit two's
+        complement range. Always True for `ovfl != 'none'` (saturation /
+        wrapping guarantee the range); with overflow handling disabled,
+        out-of-range values must not take the vectorized string converters,
+        which silently mask to W bits, but the `np.binary_repr` fallback,
+        which width-extends like the scalar path."""
+        if self.q_dict['ovfl'] != 'none':
+            return True
+        return bool(np.all((y_fix_int >= self._min_i)
+                           & (y_fix_int <= self._max_i)))
+
+    # --------------------------------------------------------------------------
+    def _fmt_dec(self, y):
+        """Quantize `y` and return it as decimal number(s), i.e. as integers
+        for `WF == 0`, else as scaled floats."""
+        if self.q_dict['WF'] == 0 and self.q_dict['quant'] != 'none':
+            # quantize directly to integers (gets rid of the trailing zero)
+            # instead of converting the float result; fixp_int() returns a
+            # copy, detached from the shared scratch buffer
+            return self.fixp_int(y, scaling='mult')
+        if self.q_dict['WF'] == 0:
+            # unquantized values are truncated towards zero like the
+            # previous astype() conversion, not rounded
+            return np.int64(self.fixp(y, scaling='mult'))
+        # the quantized & saturated / wrapped fixpoint (type float) is
+        # already the scaled float value, no integer round trip needed
+        return self.fixp(y, scaling='mult')
 
-            if isinstance(y_str, np.ndarray) and np.ndim(y_str) < 1:
-                y_str = y_str.item()  # convert singleton array to scalar
+    # --------------------------------------------------------------------------
+    def _fmt_csd(self, y):
+        """Quantize `y` and return it as string(s) in CSD format."""
+        q_dict = self.q_dict
+        W = q_dict['W']
+        if W <= 16 and q_dict['ovfl'] != 'none' and q_dict['quant'] != 'none':
+            # for small word lengths every representable (quantized) value
+            # has a precomputable CSD string: index the cached lookup table
+            # with the two's complement integer representation. Unquantized
+            # values are not integer multiples of the LSB (and wrapping can
+            # put them just outside the table), so they take the generic
+            # conversion below
+            lut = _csd_lut(W, q_dict['WF'])
+            # the scratch-buffer view is consumed immediately, no copy needed
+            y_fix_int = self.fixp(y, scaling='mult', int_frmt=True)
+            # mask the index to W bits: extreme values (|yq| >= 2**62 in LSB
+            # units) take the floating point wraparound fallback which can
+            # land exactly on +2 MSB, one past the end of the table; the
+            # mask maps that onto MIN like the integer bitmask wrap
+            return lut[(y_fix_int + (1 << (W - 1))) & ((1 << W) - 1)]
+        y_fix = self.fixp(y, scaling='mult')
+        return dec2csd_vec(y_fix, q_dict['WF'])  # convert with WF frac. bits
+
+    # --------------------------------------------------------------------------
+    def _fmt_bin(self, y):
+        """Quantize `y` and return it as string(s) in two's complement binary
+        format with a radix point for `WF > 0`."""
+        q_dict = self.q_dict
+        # represent fixpoint number as integer in the range
+        # -2**(W-1) ... 2**(W-1), quantizing directly in the integer domain;
+        # the scratch-buffer view is consumed immediately, no copy needed
+        y_fix_int = self.fixp(y, scaling='mult', int_frmt=True)
+        if (np.ndim(y_fix_int) > 0 and q_dict['W'] <= 64
+                and self._in_int_range(y_fix_int)):
+            if q_dict['WF'] > 0:  # emit the radix point in the same pass
+                return dec2bin_arr(y_fix_int, q_dict['W'],
+                                   point_pos=q_dict['WI'])
+            return dec2bin_arr(y_fix_int, q_dict['W'])
+
+        y_bin_str = binary_repr_vec(y_fix_int, q_dict['W'])
+        if q_dict['WF'] > 0:  # insert radix point if required
+            return insert_binary_point(y_bin_str, q_dict['WI'])
+        return y_bin_str
 
-            return y_str
+    # --------------------------------------------------------------------------
+    def _fmt_hex(self, y):
+        """Quantize `y` and return it as string(s) in hex format with a radix
+        point for `WF > 0`."""
+        q_dict = self.q_dict
+        # the scratch-buffer view is consumed immediately, no copy needed
+        y_fix_int = self.fixp(y, scaling='mult', int_frmt=True)
+        in_range = self._in_int_range(y_fix_int)
+        if np.ndim(y_fix_int) > 0 and q_dict['W'] < 63 and in_range:
+            # encode the hex digits directly from the integer
+            # representation, skipping the binary strings
+            return _fix2hex_array(y_fix_int, q_dict['W'], q_dict['WI'])
+        # scalars, very long words and unsaturated out-of-range values go
+        # through the binary string
+        if np.ndim(y_fix_int) > 0 and q_dict['W'] <= 64 and in_range:
+            y_bin_str = dec2bin_arr(y_fix_int, q_dict['W'])
         else:
-            raise Exception(f"""Unknown number format "{self.q_dict['fx_base']}"!""")
+            y_bin_str = binary_repr_vec(y_fix_int, q_dict['W'])
+        return bin2hex_vec(y_bin_str, q_dict['WI'])
 
 ########################################
 
@@ -1138,7 +1800,7 @@ def quant_coeffs(coeffs: iterable, QObj, recursive: bool = False) -> list:
 
 
 ########################################
-if __name__ == '__main__':
+def _demo():
     """
     Run a simple test with python -m pyfda.libs.pyfda_fix_lib
     or a more elaborate one with
@@ -1152,6 +1814,11 @@ if __name__ == '__main__':
 
     myQ.set_qdict(q_dict)
 
+    # warm up the numba JIT cache (cache=True persists the compiled kernel
+    # to __pycache__) with one vectorized call before the timing-sensitive
+    # scalar loops below
+    myQ.float2frmt(np.zeros(_NUMBA_MIN_SIZE))
+
     print("\nTesting float2frmt()\n====================")
     pprint.pprint(q_dict)
     for y in y_list:
@@ -1163,4 +1830,10 @@ if __name__ == '__main__':
     myQ.set_qdict(q_dict)
     dec_list = [-9, -8, -7, -4.0, -3.578, 0, 0.5, 4, 7, 8]
     for dec in dec_list:
-        print("y={0}\t->\ty_fix={1} ({2})".format(dec, myQ.frmt2float(dec), myQ.frmt))
+        print("y={0}\t->\ty_fix={1} ({2})".format(
+            dec, myQ.frmt2float(dec), myQ.q_dict['fx_base']))
+
+
+########################################
+if __name__ == '__main__':
+    _demo()
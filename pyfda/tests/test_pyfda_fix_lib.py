@@ -195,6 +195,23 @@ class TestSequenceFunctions(unittest.TestCase):
         self.assertEqual(yq_list, yq_list_goal)
 
 
+    def test_fix_no_quant_scalar(self):
+        """
+        Test scalar inputs that bypass the pure Python fast path (strings,
+        0-dim arrays, non-finite values) with quant == 'none' and active
+        overflow handling (regression: raised AttributeError)
+        """
+        q_dict = {'WI':2, 'WF':3, 'ovfl':'sat', 'quant':'none', 'fx_base': 'dec', 'scale': 1}
+        self.myQ.set_qdict(q_dict)
+        self.assertEqual(self.myQ.fixp("3.5"), 3.5)
+        self.assertEqual(self.myQ.fixp(np.array(5.5)), 3.875)  # saturated to MAX
+        self.assertEqual(self.myQ.fixp(np.inf), 3.875)
+        self.assertTrue(np.isnan(self.myQ.fixp(np.nan)))
+
+        q_dict = {'WI':2, 'WF':3, 'ovfl':'wrap', 'quant':'none', 'fx_base': 'dec', 'scale': 1}
+        self.myQ.set_qdict(q_dict)
+        self.assertEqual(self.myQ.fixp("5.5"), -2.5)
+
     def test_fix_wrap(self):
         """
         Test wrap around
@@ -215,6 +232,60 @@ class TestSequenceFunctions(unittest.TestCase):
         yq_list_goal = [7.0, -8.0, -4, 0, 4, 7, 7.5, -8, -7.5]
         self.assertEqual(yq_list, yq_list_goal)
 
+        # corner case: values where sign(y) * 2 MSB + y is an exact multiple
+        # of 4 MSB used to wrap to +2 MSB (outside the representable range),
+        # they must wrap to MIN; Q0.2 -> MIN = -1.0, MSB = 1.0
+        q_dict = {'WI':0, 'WF':2, 'ovfl':'wrap', 'quant':'round', 'fx_base': 'dec', 'scale': 1}
+        self.myQ.set_qdict(q_dict)
+        y_list_corner = [-5.0, -3.0, -1.0, 1.0, 3.0, 0.5, 2.25]
+        yq_list = list(map(self.myQ.fixp, y_list_corner))
+        yq_list_goal = [-1.0, -1.0, -1.0, -1.0, -1.0, 0.5, 0.25]
+        self.assertEqual(yq_list, yq_list_goal)
+        # ... and the same values as an array:
+        yq_arr = self.myQ.fixp(np.array(y_list_corner))
+        np.testing.assert_array_equal(yq_arr, yq_list_goal)
+
+
+    def test_fix_numba_parity(self):
+        """
+        Check that the parallel numba kernel and the vectorized NumPy path
+        return identical results and overflow counters for every combination
+        of quantization and overflow method. Arrays smaller than
+        fix_lib._NUMBA_MIN_SIZE never reach the kernel, so a large array is
+        required here.
+        """
+        if not fix_lib.NUMBA:
+            self.skipTest("numba not available")
+
+        rnd = np.random.RandomState(42)
+        N = 2 * fix_lib._NUMBA_MIN_SIZE
+        # values well beyond the Q1.4 range to trigger (multiple) overflows,
+        # plus exact LSB multiples and half-LSB ties for the rounding modes:
+        y = rnd.uniform(-8, 8, N)
+        y[:N // 4] = np.round(y[:N // 4] * 32) / 32
+
+        for quant in ('floor', 'round', 'fix', 'ceil', 'rint', 'none'):
+            for ovfl in ('sat', 'wrap', 'none'):
+                q_dict = {'WI':1, 'WF':4, 'ovfl':ovfl, 'quant':quant,
+                          'fx_base': 'dec', 'scale': 1}
+                self.myQ.set_qdict(q_dict)
+                try:
+                    fix_lib.NUMBA = False
+                    self.myQ.resetN()
+                    yq_np = self.myQ.fixp(y)
+                    cnt_np = (self.myQ.q_dict['N_over_neg'],
+                              self.myQ.q_dict['N_over_pos'])
+                    fix_lib.NUMBA = True
+                    self.myQ.resetN()
+                    yq_nb = self.myQ.fixp(y)
+                    cnt_nb = (self.myQ.q_dict['N_over_neg'],
+                              self.myQ.q_dict['N_over_pos'])
+                finally:
+                    fix_lib.NUMBA = True
+                np.testing.assert_array_equal(
+                    yq_nb, yq_np, err_msg=f"quant='{quant}', ovfl='{ovfl}'")
+                self.assertEqual(cnt_nb, cnt_np,
+                                 msg=f"quant='{quant}', ovfl='{ovfl}'")
 
     def test_float2frmt_bin(self):
         """
@@ -253,6 +324,18 @@ class TestSequenceFunctions(unittest.TestCase):
         yq_list = list(self.myQ.float2frmt(self.y_list))
         self.assertEqual(yq_list, yq_list_goal)
 
+        # Q3.4, overflow handling disabled: out-of-range values width-extend
+        # instead of being masked to W bits, identically for scalar and
+        # array input (regression)
+        q_dict = {'WI':3, 'WF':4, 'ovfl':'none', 'quant':'round', 'fx_base': 'bin', 'scale': 1}
+        self.myQ.set_qdict(q_dict)
+        y_list = [-17.3, -1.0, 0.25, 17.3]
+        yq_list_goal = ['1011.101011', '1111.0000', '0000.0100', '1000.10101']
+        yq_list = list(map(self.myQ.float2frmt, y_list))
+        self.assertEqual(yq_list, yq_list_goal)
+        yq_list = list(self.myQ.float2frmt(y_list))
+        self.assertEqual(yq_list, yq_list_goal)
+
     def test_float2frmt_hex(self):
         """
         Conversion from float to hex format
@@ -302,6 +385,18 @@ class TestSequenceFunctions(unittest.TestCase):
         yq_arr = list(self.myQ.float2frmt(self.y_list))
         self.assertEqual(yq_arr, yq_list_goal)
 
+        # Q3.4, overflow handling disabled: out-of-range values width-extend
+        # instead of being masked to W bits, identically for scalar and
+        # array input (regression)
+        q_dict = {'WI':3, 'WF':4, 'ovfl':'none', 'quant':'round', 'fx_base': 'hex', 'scale': 1}
+        self.myQ.set_qdict(q_dict)
+        y_list = [-17.3, -1.0, 0.25, 17.3]
+        yq_list_goal = ['B.AC', 'F.0', '0.4', '8.A8']
+        yq_list = list(map(self.myQ.float2frmt, y_list))
+        self.assertEqual(yq_list, yq_list_goal)
+        yq_list = list(self.myQ.float2frmt(y_list))
+        self.assertEqual(yq_list, yq_list_goal)
+
     def test_float2frmt_csd(self):
         """
         Conversion from float and dec to CSD format
@@ -352,6 +447,16 @@ class TestSequenceFunctions(unittest.TestCase):
         yq_arr = list(self.myQ.float2frmt(self.y_list))
         self.assertEqual(yq_arr, yq_list_goal)
 
+        # extreme values (>= 2**62 in LSB units) wrap via the floating point
+        # fallback and can land exactly on +2 MSB: the LUT index must wrap
+        # this to MIN instead of overrunning the table (regression)
+        q_dict = {'WI':7, 'WF':8, 'ovfl':'wrap', 'quant':'round', 'fx_base': 'csd', 'scale': 1}
+        self.myQ.set_qdict(q_dict)
+        y_huge = -(2**62 + 2**15) * self.myQ.q_dict['LSB']
+        yq_goal = self.myQ.float2frmt(self.myQ.q_dict['MIN'])
+        self.assertEqual(self.myQ.float2frmt(y_huge), yq_goal)
+        self.assertEqual(list(self.myQ.float2frmt([y_huge])), [yq_goal])
+
 #================== FRMT -> FLOAT ===============================================
 
     def test_frmt2float_float(self):
@@ -411,6 +516,11 @@ class TestSequenceFunctions(unittest.TestCase):
         #yq_list = list(self.myQ.frmt2float(y_list))
         #self.assertEqual(yq_list, yq_list_goal)
 
+        # '|' is an illegal character and must be stripped, it is not part
+        # of the character classes (regression)
+        yq_list = list(map(self.myQ.frmt2float, ['01|11', '|0100', '1111|']))
+        self.assertEqual(yq_list, [7, 4, -1])
+
     def test_frmt2float_hex(self):
         """
         Test conversion from hex format to float